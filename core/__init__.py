@@ -6,9 +6,12 @@ Cross-platform vulnerability scanner with geek-style CLI interface
 __version__ = "2.0.0"
 __author__ = "i0Ek3"
 
-from .base_scanner import BaseScanner
+from .base_scanner import BaseScanner, create_session
 from .config import Config
 from .ui import UI
 from .reporter import Reporter
+from .http_cache import ResponseCache
+from .payload_set import PayloadSet
+from .payload_ranker import PayloadRanker
 
-__all__ = ["BaseScanner", "Config", "UI", "Reporter"]
+__all__ = ["BaseScanner", "create_session", "Config", "UI", "Reporter", "ResponseCache", "PayloadSet", "PayloadRanker"]
@@ -3,9 +3,85 @@ Base Scanner Abstract Class
 All vulnerability scanners inherit from this class
 """
 
+import asyncio
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Tuple, Set, Callable, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qs, quote_plus, SplitResult
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import Config
+from .http_cache import ResponseCache, read_snapshot
+from .param_filter import filter_params
+from .payload_set import PayloadSet, DEFAULT_PAYLOADS
+
+
+# Low-cardinality vulnerability fields whose string values are interned, so
+# findings repeating the same type/parameter/payload share one string object
+# (per-finding text such as description/details is left alone)
+_INTERNED_FIELDS = frozenset({"type", "issue", "parameter", "payload"})
+
+
+@lru_cache(maxsize=1024)
+def _parse_url(url: str) -> SplitResult:
+    """Split URL once and share the result across all scanners"""
+    return urlsplit(url)
+
+
+@lru_cache(maxsize=1024)
+def _parse_query(query: str) -> Dict[str, str]:
+    """Parse query string into single-valued params (cached, do not mutate)"""
+    params = parse_qs(query)
+    # Convert parse_qs output (list values) to single string
+    return {k: v[0] for k, v in params.items()}
+
+
+@lru_cache(maxsize=4096)
+def _quote(value: str) -> str:
+    """Form-encode a query component (cached: payloads repeat across parameters and scanners)"""
+    return quote_plus(value)
+
+
+# Per-host request slots shared by every scanner, so concurrently running
+# scanners together never exceed Config.MAX_REQUESTS_PER_HOST in-flight requests
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Get the request slot semaphore for the URL's host"""
+    host = _parse_url(url).netloc
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(Config.MAX_REQUESTS_PER_HOST)
+    return slot
+
+
+def create_session(pool_size: int = Config.MAX_WORKERS) -> requests.Session:
+    """
+    Create a session with keep-alive connection pools sized for concurrent probes
+    Share one session between scanners to reuse connections across them
+    :param pool_size: Pooled connections kept per host
+    :return: Configured session (failed probes are not retried)
+    """
+    session = requests.Session()
+    # Accept-Encoding is left at the requests default, which already advertises
+    # every codec urllib3 can decode (gzip, deflate, plus br when brotli is installed);
+    # naming br without a decoder would hand scanners undecoded bodies
+    adapter = HTTPAdapter(
+        pool_connections=Config.POOL_HOSTS,
+        pool_maxsize=pool_size,
+        max_retries=0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class BaseScanner(ABC):
@@ -14,13 +90,37 @@ class BaseScanner(ABC):
     Provides common functionality and enforces interface contract
     """
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        cache: ResponseCache = None,
+        payloads: PayloadSet = None,
+        test_all: bool = False,
+        session: requests.Session = None
+    ):
         """
         Initialize base scanner
         :param timeout: HTTP request timeout in seconds
+        :param cache: Response cache shared across scanners (default: private cache)
+        :param payloads: Payload set shared across scanners (default: Config payloads)
+        :param test_all: Inject into every parameter, including opaque tokens
+        :param session: Session shared across scanners (default: private session)
         """
         self.timeout = timeout
+        self.test_all = test_all
+        self.cache = cache or ResponseCache()
+        self.payloads = payloads or DEFAULT_PAYLOADS
         self.vulnerabilities: List[Dict[str, Any]] = []
+        # Confirmed (family, ..., parameter) keys used for early exit
+        self._confirmed: Set[Tuple[str, ...]] = set()
+        # Tags of the probes actually sent by _dispatch (skipped probes excluded)
+        self._sent_tags: Set[Any] = set()
+        # Per-host prepared GET (session headers/cookies applied) and send settings,
+        # copied for every unshared probe instead of preparing each request from scratch
+        self._templates: Dict[str, Tuple[requests.PreparedRequest, Dict[str, Any]]] = {}
+
+        # Persistent session: keep-alive connections shared by all requests of this scanner
+        self.session = session or create_session()
 
     @property
     @abstractmethod
@@ -37,7 +137,10 @@ class BaseScanner(ABC):
     @property
     @abstractmethod
     def scan_type(self) -> str:
-        """Scanner type identifier (e.g., 'xss', 'sqli')"""
+        """
+        Scanner type identifier (e.g., 'xss', 'sqli')
+        Subclasses override this with a plain class attribute
+        """
         pass
 
     @abstractmethod
@@ -50,16 +153,52 @@ class BaseScanner(ABC):
         """
         pass
 
+    async def scan_async(self, target_url: str, params: Dict[str, str] = None) -> List[Dict[str, Any]]:
+        """
+        Run scan on the event loop so several scanners share the network wait time
+        Default runs the blocking scan in the loop's executor; override for native async I/O
+        :param target_url: Target URL to scan
+        :param params: Optional URL parameters
+        :return: List of found vulnerabilities
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.scan, target_url, params)
+
+    @property
+    def sent_payloads(self) -> Set[str]:
+        """
+        Payloads the last scan actually sent (payload probes are tagged (parameter, payload))
+        :return: Payload strings, empty if no payload probe went out
+        """
+        return {tag[1] for tag in self._sent_tags if isinstance(tag, tuple)}
+
+    @classmethod
+    def applicable(cls, caps: Dict[str, Any]) -> bool:
+        """
+        Check whether this scanner is worth running against the target
+        Override in subclasses to skip targets that lack the required signature
+        :param caps: Target capabilities detected from the target URL
+        :return: True if the scanner should run
+        """
+        return True
+
     def extract_params(self, target_url: str) -> Dict[str, str]:
         """
         Extract URL parameters from target URL
         :param target_url: URL to parse
         :return: Dictionary of parameters
         """
-        parsed_url = urlparse(target_url)
-        params = parse_qs(parsed_url.query)
-        # Convert parse_qs output (list values) to single string
-        return {k: v[0] for k, v in params.items()} if params else {}
+        # Copy so callers can't mutate the cached dictionary
+        return dict(_parse_query(_parse_url(target_url).query))
+
+    def injectable_params(self, params: Dict[str, str]) -> Dict[str, str]:
+        """
+        Get the parameters worth injecting payloads into
+        Skipped parameters are still sent with their original values
+        :param params: URL parameters
+        :return: Parameters without opaque tokens (all of them with test_all)
+        """
+        return params if self.test_all else filter_params(params)
 
     def get_base_url(self, target_url: str) -> str:
         """
@@ -67,8 +206,150 @@ class BaseScanner(ABC):
         :param target_url: Full URL
         :return: Base URL
         """
-        return target_url.split("?")[0]
+        return urlunsplit(_parse_url(target_url)._replace(query="", fragment=""))
+
+    def _url_builder(self, base_url: str, params: Dict[str, str]) -> Callable[[str, str], str]:
+        """
+        Pre-encode the probe URL around every parameter, so injecting a payload is a string join
+        :param base_url: URL without query (from get_base_url)
+        :param params: Original parameters
+        :return: Function (param, payload) -> probe URL with params[param] set to payload
+        """
+        prefix = requests.Request("GET", base_url).prepare().url + "?"
+        pairs = [f"{_quote(k)}={_quote(v)}" for k, v in params.items()]
+        templates = {}
+        for i, param in enumerate(params):
+            head = "".join(pair + "&" for pair in pairs[:i])
+            tail = "".join("&" + pair for pair in pairs[i + 1:])
+            templates[param] = (f"{prefix}{head}{_quote(param)}=", tail)
+        # Parameters not in the original query are appended (same as a dict copy + assignment)
+        extra = prefix + "".join(pair + "&" for pair in pairs)
+
+        def build(param: str, payload: str) -> str:
+            head, tail = templates.get(param) or (f"{extra}{_quote(param)}=", "")
+            return f"{head}{_quote(payload)}{tail}"
+
+        return build
+
+    def _send_probe(self, url: str, **request_kwargs) -> requests.Response:
+        """
+        Send a streamed GET for a fully encoded URL from the host's prepared template
+        :param url: Probe URL (e.g., from _url_builder)
+        :param request_kwargs: Extra arguments for session.send (e.g., allow_redirects)
+        :return: Streamed response
+        """
+        host = _parse_url(url).netloc
+        template = self._templates.get(host)
+        if template is None:
+            prepared = self.session.prepare_request(requests.Request("GET", url))
+            settings = self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+            template = self._templates[host] = (prepared, settings)
+        prepared, settings = template
+
+        probe = prepared.copy()
+        probe.url = url
+        return self.session.send(probe, **{**settings, "stream": True, "timeout": self.timeout, **request_kwargs})
+
+    def _dispatch(
+        self,
+        tasks: Iterable[Tuple[Any, str, Dict[str, str], bool]],
+        workers: int = Config.MAX_WORKERS,
+        skip: Optional[Callable[[Any], bool]] = None,
+        check: Optional[Callable[[Any, Any], Any]] = None,
+        chain: Optional[Callable[[Any], Any]] = None,
+        payload_probes: bool = True,
+        **request_kwargs
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Send GET probes concurrently through a bounded thread pool
+        In-flight requests per host are additionally capped across all scanners
+        :param tasks: (tag, url, params, shared) tuples; tag is handed back with the response,
+                      shared probes (sent by several scanners) go through the response cache,
+                      the others are sent from a prepared template with params=None and the
+                      query already encoded in url
+        :param workers: Maximum number of in-flight requests
+        :param skip: Called with a task's tag right before sending; True drops the probe
+                     (tags of the probes that do go out are recorded, see sent_payloads)
+        :param check: Called in the worker with (tag, response); its result is yielded instead
+                      of the response (None drops it), so bodies are released once analysed
+        :param chain: Called with a task's tag; tasks with the same key are sent one after
+                      another by a single worker, so findings check confirms (see _confirm)
+                      are seen by skip before the next task of the chain goes out
+                      (default: every task is sent on its own)
+        :param payload_probes: Shared tasks are payload probes, cached whatever their status so
+                               other scanners never re-send them (False for baselines, which
+                               follow the cache's RFC 9111 status rules)
+        :param request_kwargs: Extra request arguments (e.g., allow_redirects)
+        :return: Iterator of (tag, response snapshot or check result), chain by chain in order
+                 of their first task, then in task order (failed/skipped/dropped probes are omitted)
+        """
+        def fetch(task: Tuple[Any, str, Dict[str, str], bool]) -> Any:
+            tag, url, params, shared = task
+            if skip is not None and skip(tag):
+                return None
+            self._sent_tags.add(tag)
+            try:
+                with _host_slot(url):
+                    if shared:
+                        response = self.cache.get_or_fetch(
+                            self.session, "GET", url, params=params, any_status=payload_probes,
+                            timeout=self.timeout, **request_kwargs
+                        )
+                    else:
+                        response = read_snapshot(self._send_probe(url, **request_kwargs))
+            except requests.exceptions.RequestException:
+                return None
+            # Analyse outside the host slot so the next request can go out meanwhile
+            return response if check is None else check(tag, response)
+
+        def run(chain_tasks: List[Tuple[Any, str, Dict[str, str], bool]]) -> List[Tuple[Any, Any]]:
+            results = []
+            for task in chain_tasks:
+                result = fetch(task)
+                if result is not None:
+                    results.append((task[0], result))
+            return results
+
+        chains: Dict[Any, List[Tuple[Any, str, Dict[str, str], bool]]] = {}
+        for index, task in enumerate(tasks):
+            chains.setdefault(index if chain is None else chain(task[0]), []).append(task)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(run, chains.values()):
+                yield from results
+
+    @staticmethod
+    def _vuln(**fields: Any) -> Dict[str, Any]:
+        """
+        Build a vulnerability dictionary with interned low-cardinality values
+        :param fields: Vulnerability fields (type, parameter, payload, url, ...)
+        :return: Vulnerability dictionary
+        """
+        return {
+            key: sys.intern(value) if key in _INTERNED_FIELDS and isinstance(value, str) else value
+            for key, value in fields.items()
+        }
+
+    def _confirm(self, *key: str):
+        """
+        Record a confirmed finding for early exit
+        Call it from the _dispatch check, so the rest of the chain is skipped right away
+        :param key: Finding key, e.g. (family, parameter) or (family, technique, parameter)
+        """
+        self._confirmed.add(key)
+
+    def _is_confirmed(self, *key: str) -> bool:
+        """
+        Check whether further probes for this key can be skipped
+        :param key: Finding key passed to _confirm
+        :return: True if confirmed and Config.STOP_ON_FIRST_HIT is enabled
+        """
+        return Config.STOP_ON_FIRST_HIT and key in self._confirmed
 
     def reset(self):
-        """Reset scanner state (clear vulnerabilities)"""
+        """Reset scanner state (clear vulnerabilities, confirmed findings, sent probes and request templates)"""
         self.vulnerabilities = []
+        self._confirmed = set()
+        self._sent_tags = set()
+        # Session cookies may have changed since the templates were prepared
+        self._templates = {}
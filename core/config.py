@@ -3,45 +3,64 @@ Configuration Management
 Centralized configuration for payloads, headers, and scanner settings
 """
 
+import os
+import re
+from typing import Optional
+
 
 class Config:
     """Centralized configuration for all scanners"""
 
     # XSS Payloads: Test for unescaped script execution
-    XSS_PAYLOADS = [
+    XSS_PAYLOADS = (
         "<script>alert(1)</script>",  # Basic XSS payload
         "<img src=x onerror=alert(1)>",  # Image tag XSS (bypasses basic script filters)
         "';alert(1);//",  # JS context escape XSS
         "<svg/onload=alert(1)>",  # SVG-based XSS
         "javascript:alert(1)",  # JavaScript protocol XSS
-    ]
+    )
 
     # SQLi Payloads: Test for SQL injection (detect error-based responses)
-    SQLI_PAYLOADS = [
+    SQLI_PAYLOADS = (
         "' OR '1'='1",  # Basic boolean-based SQLi
         '" OR "1"="1',  # Double quote variant
         "' UNION SELECT NULL--",  # Union-based SQLi
         "1; DROP TABLE users--",  # Destructive (only for testing, avoid in production)
         "' AND 1=2 UNION SELECT NULL--",  # Advanced union-based
         "admin'--",  # Comment-based bypass
-    ]
+    )
+
+    # Time-Based SQLi Payloads: Delay the response by SQLI_SLEEP_SECONDS when injectable
+    # (kept few: each one holds a request slot for the whole delay)
+    SQLI_SLEEP_SECONDS = 5
+    SQLI_TIME_PAYLOADS = (
+        f"' AND SLEEP({SQLI_SLEEP_SECONDS})-- ",  # MySQL
+        f"'; WAITFOR DELAY '0:0:{SQLI_SLEEP_SECONDS}'--",  # SQL Server
+        f"' AND 1=(SELECT 1 FROM PG_SLEEP({SQLI_SLEEP_SECONDS}))--",  # PostgreSQL
+    )
+    SQLI_SLEEP_THRESHOLD = 4.0  # Extra delay over baseline (seconds) confirming a sleep (1s jitter margin)
 
     # Open Redirect Payloads: Test for unvalidated redirect parameters
-    REDIRECT_PARAMS = ["redirect", "url", "next", "return", "goto", "redir", "continue"]
+    REDIRECT_PARAMS = ("redirect", "url", "next", "return", "goto", "redir", "continue")  # Probe order
     MALICIOUS_REDIRECT_TARGET = "https://malicious-example.com"
 
+    # Parameter Filtering: Opaque values skipped by injection scanners (override with --test-all)
+    PARAM_MAX_VALUE_LENGTH = 512  # Longer values are treated as opaque blobs
+    PARAM_BASE64_MIN_LENGTH = 200  # Base64-looking values above this length are treated as opaque
+    OPAQUE_PARAM_NAMES = frozenset({"samlrequest", "samlresponse", "relaystate", "jwt", "state", "code", "signature"})
+
     # HTTP Misconfiguration Checks: Key security headers/methods to validate
-    REQUIRED_SECURITY_HEADERS = [
+    REQUIRED_SECURITY_HEADERS = (  # Tuple: report order follows this list
         "X-Frame-Options",  # Prevent clickjacking
         "X-XSS-Protection",  # Enable XSS protection in older browsers
         "Content-Security-Policy",  # Mitigate XSS/other injection attacks
         "Strict-Transport-Security",  # Enforce HTTPS (HSTS)
         "X-Content-Type-Options",  # Prevent MIME type sniffing
-    ]
-    FORBIDDEN_HTTP_METHODS = ["TRACE", "TRACK"]  # Insecure HTTP methods
+    )
+    FORBIDDEN_HTTP_METHODS = frozenset({"TRACE", "TRACK"})  # Insecure HTTP methods
 
     # SQL Error Patterns: Database error signatures
-    SQL_ERROR_PATTERNS = [
+    SQL_ERROR_PATTERNS = (
         "MySQL server version for the right syntax",  # MySQL error
         "PG::SyntaxError:",  # PostgreSQL error
         "ORA-01756:",  # Oracle error
@@ -50,17 +69,51 @@ class Config:
         "SQL syntax",  # Generic SQL error
         "mysql_fetch",  # MySQL function error
         "Warning: pg_",  # PostgreSQL warning
-    ]
+    )
+    # All error signatures compiled into one lowercase bytes alternation (single pass over the
+    # lowercased raw body; avoids re.IGNORECASE, which defeats sre's literal-prefix scanning)
+    SQL_ERROR_REGEX = re.compile(b"|".join(re.escape(p.lower().encode()) for p in SQL_ERROR_PATTERNS))
+    SQL_ERROR_BY_LOWER = {p.lower().encode(): p for p in SQL_ERROR_PATTERNS}  # Match -> original pattern
+    # Cheap lowercase keywords gating the regex (every pattern contains at least one)
+    SQL_ERROR_KEYWORDS = (b"mysql", b"ora-", b"pg_", b"pg::", b"sqlite", b"sql syntax", b"quotation mark")
 
     # Scanner Settings
     DEFAULT_TIMEOUT = 10  # HTTP request timeout in seconds
     MAX_REDIRECTS = 5  # Maximum number of redirects to follow
     RESPONSE_LENGTH_THRESHOLD = 50  # Threshold for boolean SQLi detection
+    STOP_ON_FIRST_HIT = True  # Stop probing a parameter once a finding is confirmed
+    MAX_CONCURRENT_SCANNERS = 4  # Maximum number of scanners running at once
+    MAX_WORKERS = 20  # Concurrent HTTP probes per scanner
+    MAX_REQUESTS_PER_HOST = 32  # In-flight requests per host across all scanners (and shared pool size)
+    POOL_HOSTS = 4  # Hosts with pooled keep-alive connections per session (target + redirect hops)
+    MAX_RESPONSE_BODY = 256 * 1024  # Maximum body bytes read per response (the rest is never downloaded)
+    READ_CHUNK_SIZE = 16 * 1024  # Body bytes read per chunk while streaming
+    CACHE_MAX_ENTRIES = 1024  # Responses kept by the shared response cache (LRU)
+
+    # Payload Ranking Settings
+    PAYLOAD_STATS_PATH = os.path.join(os.path.expanduser("~"), ".vscanner", "payload_stats.json")
+    PAYLOAD_SCORE_DECAY = 0.9  # Weight of previous score per scan (recent hits count more)
 
     # UI Settings
     BANNER_FONT = "slant"  # ASCII art font (pyfiglet)
     PROGRESS_REFRESH_RATE = 10  # Progress bar refresh rate (Hz)
+    TABLE_COMPACT_THRESHOLD = 50  # Drop row separators above this many findings
+    TABLE_MAX_ROWS = 100  # Maximum findings rendered in the terminal table
 
     # Report Settings
     DEFAULT_REPORT_FORMAT = "json"
     REPORT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    @classmethod
+    def search_sql_error(cls, body: bytes) -> Optional[str]:
+        """
+        Search response body for a SQL error signature
+        Clean bodies are rejected by a keyword check without running the regex
+        :param body: Raw response body (signatures are ASCII, so no decoding is needed)
+        :return: Matched entry of SQL_ERROR_PATTERNS, or None
+        """
+        lowered = body.lower()
+        if not any(keyword in lowered for keyword in cls.SQL_ERROR_KEYWORDS):
+            return None
+        match = cls.SQL_ERROR_REGEX.search(lowered)
+        return cls.SQL_ERROR_BY_LOWER[match.group(0)] if match else None
@@ -0,0 +1,154 @@
+"""
+HTTP Response Cache
+Share baseline/discovery responses between scanners during a scan run
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, NamedTuple, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .config import Config
+
+
+class ResponseSnapshot(NamedTuple):
+    """Snapshot of the response fields scanners rely on"""
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes  # Raw body bytes; scanners match their byte signatures without decoding
+    url: str
+    elapsed: float  # Seconds from sending the request until its headers arrived
+
+
+def read_snapshot(response: requests.Response, max_body: int = Config.MAX_RESPONSE_BODY) -> ResponseSnapshot:
+    """
+    Read at most max_body bytes of a streamed response and release its connection
+    Fully read bodies hand the connection back to the pool; truncated ones close it
+    :param response: Response sent with stream=True
+    :param max_body: Maximum number of (decompressed) body bytes kept
+    :return: Response snapshot
+    """
+    chunks = []
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=Config.READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_body:
+                break
+    finally:
+        response.close()
+
+    return ResponseSnapshot(
+        status_code=response.status_code,
+        headers=response.headers,
+        content=b"".join(chunks)[:max_body],
+        url=response.url,
+        elapsed=response.elapsed.total_seconds(),
+    )
+
+
+class ResponseCache:
+    """
+    In-process LRU response cache keyed by request shape
+    Use it for baseline/discovery requests and payload probes shared by several scanners;
+    other payload probes must reach the target
+    """
+
+    # Status codes heuristically cacheable by default (RFC 9111, section 4.2.2);
+    # other responses are handed to waiting callers but never stored (unless any_status)
+    CACHEABLE_STATUS_CODES = frozenset({200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501})
+
+    def __init__(self, max_body: int = Config.MAX_RESPONSE_BODY, max_entries: int = Config.CACHE_MAX_ENTRIES):
+        """
+        Initialize response cache
+        :param max_body: Maximum number of body bytes kept per entry
+        :param max_entries: Maximum number of cached responses (least recently used are evicted)
+        """
+        self.max_body = max_body
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, ResponseSnapshot]" = OrderedDict()
+        # In-flight fetches, so concurrent callers of the same request wait instead of re-sending it
+        self._pending: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        params: Dict[str, str] = None,
+        any_status: bool = False,
+        **kwargs: Any
+    ) -> ResponseSnapshot:
+        """
+        Return cached response for this request, fetching it on first use
+        Request errors propagate to the caller and are never cached
+        :param session: Session used to send the request on a cache miss
+        :param method: HTTP method
+        :param url: Request URL
+        :param params: Query parameters
+        :param any_status: Store the response whatever its status code (shared payload probes,
+                           whose error pages, e.g. SQL errors behind a 500, the other scanners need)
+        :param kwargs: Extra arguments for session.request (e.g., timeout)
+        :return: Cached response snapshot
+        """
+        key = (
+            method.upper(),
+            url,
+            tuple(sorted((params or {}).items())),
+            kwargs.get("allow_redirects", True),
+        )
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+            pending = self._pending.get(key)
+            owner = cached is None and pending is None
+            if owner:
+                pending = self._pending[key] = Future()
+        if cached is not None:
+            return cached
+        if not owner:
+            # Another thread is fetching this request; share its result (or error)
+            return pending.result()
+
+        try:
+            response = session.request(method, url, params=params, stream=True, **kwargs)
+            cached = read_snapshot(response, self.max_body)
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            if any_status or cached.status_code in self.CACHEABLE_STATUS_CODES:
+                self._entries[key] = cached
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            del self._pending[key]
+        pending.set_result(cached)
+        return cached
+
+    def get_headers(self, session: requests.Session, url: str, **kwargs: Any) -> ResponseSnapshot:
+        """
+        Fetch response headers with HEAD, falling back to GET if the server rejects HEAD
+        :param session: Session used to send the request on a cache miss
+        :param url: Request URL
+        :param kwargs: Extra arguments for session.request (e.g., timeout)
+        :return: Cached response snapshot (empty body unless the GET fallback was used)
+        """
+        response = self.get_or_fetch(session, "HEAD", url, **kwargs)
+        if response.status_code == 405:
+            response = self.get_or_fetch(session, "GET", url, **kwargs)
+        return response
+
+    def clear(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,46 @@
+"""
+Parameter Filter
+Skip parameters whose values are opaque tokens that payloads cannot meaningfully alter
+"""
+
+import re
+from typing import Dict
+
+from .config import Config
+
+
+# Long hex digests (session IDs, hashes, CSRF tokens); all-digit values are numbers, not digests
+_HEX_TOKEN = re.compile(r"(?=[0-9]*[a-fA-F])[0-9a-fA-F]{32,}")
+# Standard or URL-safe base64 blobs (SAML messages, serialized state)
+_BASE64_BLOB = re.compile(r"[A-Za-z0-9+/_-]+={0,2}")
+# JWTs under any parameter name: base64url header.payload.signature, the header
+# always being a JSON object ('{"' encodes to "eyJ"), so dotted values like
+# host names or version numbers are kept
+_JWT = re.compile(r"eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*")
+
+
+def is_interesting(name: str, value: str) -> bool:
+    """
+    Check whether a parameter is worth injecting payloads into
+    :param name: Parameter name
+    :param value: Original parameter value
+    :return: False for oversized values, known token parameters and opaque blobs
+    """
+    if len(value) > Config.PARAM_MAX_VALUE_LENGTH:
+        return False
+    if name.lower() in Config.OPAQUE_PARAM_NAMES:
+        return False
+    if _HEX_TOKEN.fullmatch(value) or _JWT.fullmatch(value):
+        return False
+    if len(value) > Config.PARAM_BASE64_MIN_LENGTH and _BASE64_BLOB.fullmatch(value):
+        return False
+    return True
+
+
+def filter_params(params: Dict[str, str]) -> Dict[str, str]:
+    """
+    Keep only parameters worth injecting payloads into
+    :param params: URL parameters
+    :return: Filtered parameters (original order kept)
+    """
+    return {name: value for name, value in params.items() if is_interesting(name, value)}
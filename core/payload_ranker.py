@@ -0,0 +1,90 @@
+"""
+Payload Ranker
+Order payloads by historical success so proven probes are sent first
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List
+
+from .config import Config
+
+
+class PayloadRanker:
+    """Per-family payload success scores, persisted between scans"""
+
+    def __init__(self, path: str = Config.PAYLOAD_STATS_PATH, decay: float = Config.PAYLOAD_SCORE_DECAY):
+        """
+        Initialize payload ranker
+        :param path: JSON file holding payload scores
+        :param decay: Weight of previous score per scan (recent scans count more)
+        """
+        self.path = path
+        self.decay = decay
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def load(self) -> "PayloadRanker":
+        """
+        Load scores from disk (missing or corrupt files start from scratch)
+        :return: self
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stats = json.load(f)
+            self.stats = stats if self._is_valid(stats) else {}
+        except (OSError, ValueError):
+            self.stats = {}
+        return self
+
+    @staticmethod
+    def _is_valid(stats: Any) -> bool:
+        """
+        Check that loaded stats map each family to a dict of numeric scores
+        :param stats: Decoded JSON content
+        :return: True if the stats can be ranked and updated
+        """
+        return isinstance(stats, dict) and all(
+            isinstance(scores, dict) and all(
+                isinstance(score, (int, float)) and not isinstance(score, bool)
+                for score in scores.values()
+            )
+            for scores in stats.values()
+        )
+
+    def rank(self, family: str, payloads: Iterable[str]) -> List[str]:
+        """
+        Order payloads by score, highest first (ties keep original order)
+        :param family: Scanner type (e.g., 'xss', 'sqli')
+        :param payloads: Payloads to rank
+        :return: Ranked payload list
+        """
+        scores = self.stats.get(family, {})
+        return sorted(payloads, key=lambda payload: -scores.get(payload, 0.0))
+
+    def record(self, family: str, payload: str, hit: bool):
+        """
+        Update payload score with the outcome of one scan
+        :param family: Scanner type
+        :param payload: Payload that was tested
+        :param hit: True if the payload produced a finding
+        """
+        scores = self.stats.setdefault(family, {})
+        scores[payload] = self.decay * scores.get(payload, 0.0) + (1.0 if hit else 0.0)
+
+    def save(self):
+        """
+        Persist scores atomically (write temp file, then os.replace)
+        :raises OSError: If the stats file cannot be written
+        """
+        dir_path = os.path.dirname(self.path) or "."
+        os.makedirs(dir_path, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.stats, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,63 @@
+"""
+Payload Set
+Family-tagged payload registry that merges probes shared by several scanners
+"""
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from .config import Config
+
+
+@dataclass(frozen=True)
+class PayloadEntry:
+    """Single probe string and the scanner families that send it"""
+    text: str
+    families: FrozenSet[str]
+
+    @property
+    def shared(self) -> bool:
+        """True if more than one scanner family sends this payload"""
+        return len(self.families) > 1
+
+
+class PayloadSet:
+    """Deduplicated payloads, each tagged with the families that use it"""
+
+    def __init__(self, entries: Iterable[PayloadEntry]):
+        """
+        Initialize payload set
+        :param entries: Payload entries (one per unique payload text)
+        """
+        self.entries: Tuple[PayloadEntry, ...] = tuple(entries)
+
+    @classmethod
+    def union(cls, families: Iterable[Tuple[str, Iterable[str]]]) -> "PayloadSet":
+        """
+        Merge payload lists of several families, deduplicating identical strings
+        :param families: (family, payloads) pairs, e.g. ("xss", Config.XSS_PAYLOADS)
+        :return: PayloadSet in first-seen order
+        """
+        merged: Dict[str, Set[str]] = {}
+        for family, payloads in families:
+            for text in payloads:
+                merged.setdefault(text, set()).add(family)
+        return cls(PayloadEntry(text, frozenset(tags)) for text, tags in merged.items())
+
+    def for_family(self, family: str) -> List[PayloadEntry]:
+        """
+        Get payloads sent by one scanner family
+        :param family: Scanner type (e.g., 'xss', 'sqli')
+        :return: Payload entries in set order
+        """
+        return [entry for entry in self.entries if family in entry.families]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# Default payloads for all injection scanners
+DEFAULT_PAYLOADS = PayloadSet.union([
+    ("xss", Config.XSS_PAYLOADS),
+    ("sqli", Config.SQLI_PAYLOADS),
+])
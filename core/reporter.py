@@ -4,11 +4,60 @@ Generate JSON, HTML, and terminal-friendly reports
 """
 
 import json
+import html
+import string
+import pkgutil
 import datetime
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .ui import UI
 
+try:
+    import orjson  # Optional: native serializer, several times faster than json
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize object to compact UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize object to compact UTF-8 JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# HTML report templates, loaded once at import (only placeholders are filled per report)
+_HTML_CSS = pkgutil.get_data(__package__, "templates/report.css").decode("utf-8")
+_HTML_PAGE = pkgutil.get_data(__package__, "templates/report.html.tmpl").decode("utf-8")
+# Split around the content slot so vulnerability cards can be streamed in between
+_HTML_HEAD, _HTML_FOOT = _HTML_PAGE.split("${content}")
+_HTML_HEAD_TMPL = string.Template(_HTML_HEAD)
+
+_HTML_VULNS_HEADING = "<h2 style='color: #dc3545; margin-bottom: 20px;'>⚠️ Detected Vulnerabilities</h2>"
+
+_HTML_VULN_TMPL = string.Template("""
+        <div class="vuln-card">
+            <h3>#${idx} - ${type}</h3>
+            <div class="vuln-detail">
+                <strong>Description:</strong> ${description}
+            </div>
+            <div class="vuln-detail">
+                <strong>URL/Parameter:</strong> <code>${url}</code>
+                ${parameter}
+            </div>
+            <div class="vuln-detail">
+                <strong>Payload/Issue:</strong> <code>${payload}</code>
+            </div>
+            <div class="vuln-detail">
+                <strong>Status Code:</strong> ${status}
+            </div>
+        </div>
+""")
+
+_HTML_NO_VULNS = """
+        <div class="no-vulns">
+            ✅ No vulnerabilities detected! Target appears secure.
+        </div>
+"""
+
 
 class Reporter:
     """Report generator for scan results"""
@@ -25,7 +74,8 @@ class Reporter:
         vulnerabilities: List[Dict[str, Any]],
         target_url: str,
         output_path: str,
-        format: str = "json"
+        format: str = "json",
+        fields: Optional[List[str]] = None
     ) -> None:
         """
         Generate scan report in specified format
@@ -33,6 +83,7 @@ class Reporter:
         :param target_url: Scanned target URL
         :param output_path: Report save path (without extension)
         :param format: Report format (json/html)
+        :param fields: Vulnerability keys to keep in JSON output (default: all)
         """
         # Construct report metadata
         report = {
@@ -49,22 +100,51 @@ class Reporter:
 
         # Generate report based on format
         if format.lower() == "json":
-            self._generate_json_report(report, output_path)
+            self._generate_json_report(report, output_path, fields)
         elif format.lower() == "html":
             self._generate_html_report(report, output_path)
         else:
             self.ui.print_error(f"Unsupported report format: {format} (supported: json/html)")
 
-    def _generate_json_report(self, report: Dict[str, Any], output_path: str) -> None:
+    def _generate_json_report(
+        self,
+        report: Dict[str, Any],
+        output_path: str,
+        fields: Optional[List[str]] = None
+    ) -> None:
         """
         Generate JSON format report
+        Vulnerabilities are serialized and written one at a time (one per line)
+        instead of building the whole document in memory
         :param report: Report data
         :param output_path: Output file path
+        :param fields: Vulnerability keys to keep (default: all)
         """
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=4, ensure_ascii=False)
+        with open(output_path, "wb") as f:
+            f.write(b"{\n")
+            for key, value in report.items():
+                if key != "vulnerabilities":
+                    f.write(b"    " + _dumps(key) + b": " + _dumps(value) + b",\n")
+
+            f.write(b'    "vulnerabilities": [')
+            for idx, vuln in enumerate(report["vulnerabilities"]):
+                f.write(b",\n        " if idx else b"\n        ")
+                f.write(_dumps(self._project(vuln, fields)))
+            f.write(b"\n    ]\n}\n")
         self.ui.print_success(f"JSON report saved to {output_path}")
 
+    @staticmethod
+    def _project(vuln: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Project vulnerability onto the requested fields
+        :param vuln: Vulnerability dictionary
+        :param fields: Keys to keep (None keeps all)
+        :return: Projected vulnerability dictionary
+        """
+        if not fields:
+            return vuln
+        return {key: vuln[key] for key in fields if key in vuln}
+
     def _generate_html_report(self, report: Dict[str, Any], output_path: str) -> None:
         """
         Generate HTML format report
@@ -72,181 +152,32 @@ class Reporter:
         :param output_path: Output file path
         """
         vulnerabilities = report["vulnerabilities"]
-        
-        # Build HTML content
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>VScanner Report - {report['target_url']}</title>
-            <style>
-                * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    padding: 20px;
-                    min-height: 100vh;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background: white;
-                    border-radius: 10px;
-                    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                    overflow: hidden;
-                }}
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    text-align: center;
-                }}
-                .header h1 {{
-                    font-size: 2.5em;
-                    margin-bottom: 10px;
-                    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-                }}
-                .metadata {{
-                    background: #f8f9fa;
-                    padding: 20px 30px;
-                    border-bottom: 3px solid #667eea;
-                }}
-                .metadata-item {{
-                    margin: 10px 0;
-                    font-size: 1.1em;
-                }}
-                .metadata-item strong {{
-                    color: #667eea;
-                    margin-right: 10px;
-                }}
-                .content {{
-                    padding: 30px;
-                }}
-                .vuln-card {{
-                    background: white;
-                    border-left: 5px solid #dc3545;
-                    margin: 20px 0;
-                    padding: 20px;
-                    border-radius: 5px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    transition: transform 0.2s;
-                }}
-                .vuln-card:hover {{
-                    transform: translateX(5px);
-                }}
-                .vuln-card h3 {{
-                    color: #dc3545;
-                    margin-bottom: 15px;
-                    font-size: 1.3em;
-                }}
-                .vuln-detail {{
-                    margin: 10px 0;
-                    padding: 8px 0;
-                    border-bottom: 1px solid #eee;
-                }}
-                .vuln-detail:last-child {{
-                    border-bottom: none;
-                }}
-                .vuln-detail strong {{
-                    color: #495057;
-                    display: inline-block;
-                    width: 150px;
-                }}
-                .no-vulns {{
-                    text-align: center;
-                    padding: 40px;
-                    color: #28a745;
-                    font-size: 1.5em;
-                }}
-                .badge {{
-                    display: inline-block;
-                    padding: 5px 15px;
-                    border-radius: 20px;
-                    font-size: 0.9em;
-                    font-weight: bold;
-                }}
-                .badge-danger {{
-                    background: #dc3545;
-                    color: white;
-                }}
-                .badge-success {{
-                    background: #28a745;
-                    color: white;
-                }}
-                code {{
-                    background: #f8f9fa;
-                    padding: 2px 6px;
-                    border-radius: 3px;
-                    font-family: 'Courier New', monospace;
-                    color: #e83e8c;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🔍 VScanner Security Report</h1>
-                    <p>Comprehensive Vulnerability Assessment</p>
-                </div>
-                
-                <div class="metadata">
-                    <div class="metadata-item">
-                        <strong>🎯 Target URL:</strong> {report['target_url']}
-                    </div>
-                    <div class="metadata-item">
-                        <strong>📅 Scan Time:</strong> {report['scan_timestamp']}
-                    </div>
-                    <div class="metadata-item">
-                        <strong>🔢 Vulnerabilities Found:</strong>
-                        <span class="badge {'badge-danger' if report['total_vulnerabilities'] > 0 else 'badge-success'}">
-                            {report['total_vulnerabilities']}
-                        </span>
-                    </div>
-                </div>
-                
-                <div class="content">
-        """
 
-        # Add vulnerability cards
-        if vulnerabilities:
-            html_content += "<h2 style='color: #dc3545; margin-bottom: 20px;'>⚠️ Detected Vulnerabilities</h2>"
-            for idx, vuln in enumerate(vulnerabilities, 1):
-                html_content += f"""
-                <div class="vuln-card">
-                    <h3>#{idx} - {vuln.get('type', 'Unknown Vulnerability')}</h3>
-                    <div class="vuln-detail">
-                        <strong>Description:</strong> {vuln.get('description', vuln.get('details', 'N/A'))}
-                    </div>
-                    <div class="vuln-detail">
-                        <strong>URL/Parameter:</strong> <code>{vuln.get('url', 'N/A')}</code>
-                        {f" (Parameter: <code>{vuln.get('parameter', 'N/A')}</code>)" if vuln.get('parameter') else ''}
-                    </div>
-                    <div class="vuln-detail">
-                        <strong>Payload/Issue:</strong> <code>{vuln.get('payload', vuln.get('issue', 'N/A'))}</code>
-                    </div>
-                    <div class="vuln-detail">
-                        <strong>Status Code:</strong> {vuln.get('status_code', 'N/A')}
-                    </div>
-                </div>
-                """
-        else:
-            html_content += """
-            <div class="no-vulns">
-                ✅ No vulnerabilities detected! Target appears secure.
-            </div>
-            """
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(_HTML_HEAD_TMPL.substitute(
+                css=_HTML_CSS,
+                target=html.escape(report["target_url"]),
+                timestamp=html.escape(report["scan_timestamp"]),
+                badge="badge-danger" if report["total_vulnerabilities"] > 0 else "badge-success",
+                count=report["total_vulnerabilities"]
+            ))
 
-        # Close HTML
-        html_content += """
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+            # Add vulnerability cards (all scanned values are escaped)
+            if vulnerabilities:
+                f.write(_HTML_VULNS_HEADING)
+                for idx, vuln in enumerate(vulnerabilities, 1):
+                    parameter = vuln.get("parameter")
+                    f.write(_HTML_VULN_TMPL.substitute(
+                        idx=idx,
+                        type=html.escape(str(vuln.get("type", "Unknown Vulnerability"))),
+                        description=html.escape(str(vuln.get("description", vuln.get("details", "N/A")))),
+                        url=html.escape(str(vuln.get("url", "N/A"))),
+                        parameter=f"(Parameter: <code>{html.escape(str(parameter))}</code>)" if parameter else "",
+                        payload=html.escape(str(vuln.get("payload", vuln.get("issue", "N/A")))),
+                        status=html.escape(str(vuln.get("status_code", "N/A")))
+                    ))
+            else:
+                f.write(_HTML_NO_VULNS)
 
-        # Save HTML report
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            f.write(_HTML_FOOT)
         self.ui.print_success(f"HTML report saved to {output_path}")
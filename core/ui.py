@@ -4,15 +4,15 @@ ASCII art, progress bars, color-coded output, and live panels
 """
 
 import sys
-from typing import Optional
+from typing import Optional, List, Dict, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 from rich.text import Text
 from rich import box
-import pyfiglet
 from colorama import init as colorama_init, Fore, Style
+from .config import Config
 
 # Initialize colorama for cross-platform color support (Windows compatibility)
 colorama_init(autoreset=True)
@@ -21,18 +21,22 @@ colorama_init(autoreset=True)
 class UI:
     """Geek-style terminal UI manager"""
 
+    # Rendered ASCII art per (text, font), shared by all UI instances
+    _BANNER_CACHE: Dict[Tuple[str, str], str] = {}
+
     def __init__(self):
         """Initialize UI components"""
         self.console = Console()
         self.progress: Optional[Progress] = None
+        self._buffer: Optional[List[str]] = None
 
     def show_banner(self, version: str = "2.0.0"):
         """
         Display ASCII art banner with tool info
         :param version: Tool version number
         """
-        # Generate ASCII art using pyfiglet
-        ascii_art = pyfiglet.figlet_format("VScanner", font="slant")
+        # Generate ASCII art using pyfiglet (rendered once, then cached)
+        ascii_art = self._render_ascii_art("VScanner", "slant")
         
         # Create styled banner
         banner_text = Text()
@@ -51,25 +55,62 @@ class UI:
         self.console.print(panel)
         self.console.print()
 
+    @classmethod
+    def _render_ascii_art(cls, text: str, font: str) -> str:
+        """
+        Render ASCII art, loading pyfiglet only on first use
+        :param text: Text to render
+        :param font: pyfiglet font name
+        :return: ASCII art string
+        """
+        key = (text, font)
+        if key not in cls._BANNER_CACHE:
+            # Deferred import: --no-banner runs never load pyfiglet or its font files
+            import pyfiglet
+            cls._BANNER_CACHE[key] = pyfiglet.figlet_format(text, font=font)
+        return cls._BANNER_CACHE[key]
+
+    def enable_buffering(self):
+        """Hold status messages in memory until flush() (for hot scan loops)"""
+        if self._buffer is None:
+            self._buffer = []
+
+    def flush(self):
+        """Render buffered status messages in a single console write and stop buffering"""
+        buffer, self._buffer = self._buffer, None
+        if not buffer:
+            return
+        # Console context manager batches all prints into one write
+        with self.console:
+            for message in buffer:
+                self.console.print(message)
+
+    def _emit(self, message: str):
+        """Print message now, or queue it while buffering is enabled"""
+        if self._buffer is not None:
+            self._buffer.append(message)
+        else:
+            self.console.print(message)
+
     def print_info(self, message: str):
         """Print info message (cyan)"""
-        self.console.print(f"[cyan][INFO][/cyan] {message}")
+        self._emit(f"[cyan][INFO][/cyan] {message}")
 
     def print_success(self, message: str):
         """Print success message (green)"""
-        self.console.print(f"[green][SUCCESS][/green] {message}")
+        self._emit(f"[green][SUCCESS][/green] {message}")
 
     def print_warning(self, message: str):
         """Print warning message (yellow)"""
-        self.console.print(f"[yellow][WARNING][/yellow] {message}")
+        self._emit(f"[yellow][WARNING][/yellow] {message}")
 
     def print_error(self, message: str):
         """Print error message (red)"""
-        self.console.print(f"[red][ERROR][/red] {message}")
+        self._emit(f"[red][ERROR][/red] {message}")
 
     def print_vulnerability(self, vuln_type: str, details: str):
         """Print vulnerability found (red, bold)"""
-        self.console.print(f"[bold red][VULN FOUND][/bold red] {vuln_type}: {details}")
+        self._emit(f"[bold red][VULN FOUND][/bold red] {vuln_type}: {details}")
 
     def create_progress_bar(self) -> Progress:
         """
@@ -116,15 +157,21 @@ class UI:
     def show_vulnerability_table(self, vulnerabilities: list):
         """
         Display vulnerabilities in a formatted table
+        Large result sets drop row separators and are capped at Config.TABLE_MAX_ROWS rows
         :param vulnerabilities: List of vulnerability dictionaries
         """
-        if not vulnerabilities:
+        # Skip when there is nothing to show or output isn't a terminal (reports have the details)
+        if not vulnerabilities or not self.console.is_terminal:
             return
 
+        # Precompute display rows (truncated payloads) before touching the table
+        shown = vulnerabilities[:Config.TABLE_MAX_ROWS]
+        rows = [self._vulnerability_row(vuln) for vuln in shown]
+
         table = Table(
             title="[bold red]Detected Vulnerabilities[/bold red]",
             box=box.ROUNDED,
-            show_lines=True,
+            show_lines=len(vulnerabilities) <= Config.TABLE_COMPACT_THRESHOLD,
             border_style="red"
         )
         
@@ -133,21 +180,34 @@ class UI:
         table.add_column("Payload/Issue", style="magenta")
         table.add_column("Status", style="white")
         
-        for vuln in vulnerabilities:
-            vuln_type = vuln.get("type", "Unknown")
-            param = vuln.get("parameter", vuln.get("issue", "N/A"))
-            payload = vuln.get("payload", vuln.get("details", "N/A"))
-            status = str(vuln.get("status_code", "N/A"))
-            
-            # Truncate long payloads
-            if len(payload) > 50:
-                payload = payload[:47] + "..."
-            
-            table.add_row(vuln_type, param, payload, status)
+        for row in rows:
+            table.add_row(*row)
+
+        hidden = len(vulnerabilities) - len(shown)
+        if hidden > 0:
+            table.add_row(f"[dim]… {hidden} more (see report)[/dim]", "", "", "")
         
         self.console.print()
         self.console.print(table)
 
+    @staticmethod
+    def _vulnerability_row(vuln: dict) -> Tuple[str, str, str, str]:
+        """
+        Build one table row from a vulnerability dictionary
+        :param vuln: Vulnerability dictionary
+        :return: (type, parameter, payload, status) strings
+        """
+        payload = str(vuln.get("payload", vuln.get("details", "N/A")))
+        # Truncate long payloads
+        if len(payload) > 50:
+            payload = payload[:47] + "..."
+        return (
+            str(vuln.get("type", "Unknown")),
+            str(vuln.get("parameter", vuln.get("issue", "N/A"))),
+            payload,
+            str(vuln.get("status_code", "N/A")),
+        )
+
     def show_divider(self, char: str = "─", style: str = "dim white"):
         """
         Show horizontal divider
@@ -7,18 +7,24 @@ Supports: XSS | SQLi | HTTP Misconfig | Open Redirect
 Platform: macOS | Linux | Windows
 """
 
+import os
 import sys
+import asyncio
 import argparse
 import datetime
-from urllib.parse import urlparse
-from typing import List
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse, parse_qs
+from typing import List, Dict, Any, Set, Tuple, Union
+
+import requests
 
 # Core framework imports
-from core import UI, Reporter, Config
+from core import UI, Reporter, Config, ResponseCache, PayloadSet, PayloadRanker, create_session
 from core.base_scanner import BaseScanner
 
 # Scanner imports
-from scanners import get_all_scanners, get_scanner_by_type
+from scanners import get_all_scanners, get_scanner_by_type, get_scan_types
 
 
 def parse_arguments():
@@ -35,14 +41,17 @@ def parse_arguments():
     # Required arguments
     parser.add_argument(
         "-u", "--url",
+        dest="urls",
+        metavar="URL",
+        nargs="+",
         required=True,
-        help="Target URL to scan (e.g., https://example.com?param=1)"
+        help="Target URL(s) to scan (e.g., https://example.com?param=1)"
     )
 
     # Optional arguments
     parser.add_argument(
         "-s", "--scan-type",
-        choices=["xss", "sqli", "http", "redirect", "all"],
+        choices=get_scan_types() + ["all"],
         default="all",
         help="Type of scan to perform (default: all)"
     )
@@ -60,6 +69,11 @@ def parse_arguments():
         help="Report format (default: json)"
     )
 
+    parser.add_argument(
+        "--fields",
+        help="Comma-separated vulnerability fields to include in JSON report (e.g., type,parameter,payload)"
+    )
+
     parser.add_argument(
         "-t", "--timeout",
         type=int,
@@ -67,6 +81,19 @@ def parse_arguments():
         help=f"HTTP request timeout in seconds (default: {Config.DEFAULT_TIMEOUT})"
     )
 
+    parser.add_argument(
+        "-p", "--processes",
+        type=int,
+        default=0,
+        help="Worker processes when scanning several targets (default: one per CPU core, at most one per host)"
+    )
+
+    parser.add_argument(
+        "--test-all",
+        action="store_true",
+        help="Inject into every parameter (by default opaque tokens like JWT/SAML blobs are skipped)"
+    )
+
     parser.add_argument(
         "--no-banner",
         action="store_true",
@@ -86,24 +113,273 @@ def validate_url(url: str) -> bool:
     return bool(parsed_url.scheme and parsed_url.netloc)
 
 
-def get_scanners_to_run(scan_type: str, timeout: int) -> List[BaseScanner]:
+def fingerprint_target(url: str) -> Dict[str, Any]:
+    """
+    Detect what the target exposes from its URL (no request is sent)
+    :param url: Target URL
+    :return: Capabilities dictionary used by BaseScanner.applicable
+    """
+    query_params = parse_qs(urlparse(url).query)
+    return {
+        "has_params": bool(query_params),
+    }
+
+
+def get_scanners_to_run(
+    scan_type: str,
+    timeout: int,
+    cache: ResponseCache = None,
+    payloads: PayloadSet = None,
+    test_all: bool = False,
+    session: requests.Session = None
+) -> List[BaseScanner]:
     """
     Get list of scanner instances to run based on scan type
     :param scan_type: Scan type ('xss', 'sqli', 'http', 'redirect', 'all')
     :param timeout: HTTP timeout setting
+    :param cache: Response cache shared by all scanners
+    :param payloads: Payload set shared by all scanners
+    :param test_all: Inject into every parameter, including opaque tokens
+    :param session: Session (connection pool) shared by all scanners
     :return: List of scanner instances
     """
     if scan_type == "all":
         # Run all available scanners
-        return [scanner_class(timeout=timeout) for scanner_class in get_all_scanners()]
+        return [
+            scanner_class(timeout=timeout, cache=cache, payloads=payloads, test_all=test_all, session=session)
+            for scanner_class in get_all_scanners()
+        ]
     else:
         # Run specific scanner
         scanner_class = get_scanner_by_type(scan_type)
         if scanner_class:
-            return [scanner_class(timeout=timeout)]
+            return [scanner_class(timeout=timeout, cache=cache, payloads=payloads, test_all=test_all, session=session)]
         return []
 
 
+def build_payloads(ranker: PayloadRanker) -> PayloadSet:
+    """
+    Build payload set with historically successful payloads first
+    :param ranker: Loaded payload ranker
+    :return: Ranked payload set
+    """
+    return PayloadSet.union([
+        ("xss", ranker.rank("xss", Config.XSS_PAYLOADS)),
+        ("sqli", ranker.rank("sqli", Config.SQLI_PAYLOADS)),
+    ])
+
+
+def record_payload_hits(
+    ranker: PayloadRanker,
+    payloads: PayloadSet,
+    sent: Dict[str, Set[str]],
+    hits: Dict[str, Set[str]]
+):
+    """
+    Feed the results of a whole scan back into the payload ranker (once per scan)
+    Payloads that were never sent (skipped after a hit, no injectable parameters) keep their score
+    :param ranker: Payload ranker
+    :param payloads: Payload set the scanners used
+    :param sent: Payloads actually sent per scanner type, over all targets
+    :param hits: Payloads that produced a finding per scanner type, over all targets
+    """
+    for scan_type, sent_payloads in sent.items():
+        for entry in payloads.for_family(scan_type):
+            if entry.text in sent_payloads:
+                ranker.record(scan_type, entry.text, entry.text in hits.get(scan_type, ()))
+
+
+def print_scanner_result(ui: UI, name: str, result: Union[List[Dict[str, Any]], BaseException, str]):
+    """
+    Print the one-line status of a finished scanner
+    :param ui: UI instance for output
+    :param name: Scanner name (may include the target for multi-target runs)
+    :param result: Vulnerability list, or the exception / error message it failed with
+    """
+    if isinstance(result, (BaseException, str)):
+        ui.print_error(f"{name} failed: {str(result)}")
+    elif result:
+        ui.print_vulnerability(name, f"Found {len(result)} issue(s)")
+    else:
+        ui.print_success(f"{name}: No vulnerabilities detected")
+
+
+async def run_scanners(
+    scanners: List[BaseScanner],
+    target_url: str,
+    ui: UI = None,
+    progress=None,
+    task_id=None
+) -> List[Any]:
+    """
+    Run scanners concurrently on one event loop (see BaseScanner.scan_async)
+    :param scanners: Scanner instances to run
+    :param target_url: Target URL to scan
+    :param ui: UI instance for per-scanner result output (None to run silently)
+    :param progress: Progress object to advance as scanners finish
+    :param task_id: Progress task ID
+    :return: Per-scanner results in scanner order (vulnerability list or exception)
+    """
+    # Cap concurrent scanners so the target host isn't flooded
+    semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_SCANNERS)
+
+    async def run_one(scanner: BaseScanner):
+        async with semaphore:
+            return await scanner.scan_async(target_url)
+
+    def on_done(scanner: BaseScanner, future: asyncio.Future):
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        print_scanner_result(ui, scanner.name, error if error is not None else future.result())
+        progress.advance(task_id)
+
+    tasks = []
+    for scanner in scanners:
+        task = asyncio.ensure_future(run_one(scanner))
+        if ui is not None:
+            task.add_done_callback(functools.partial(on_done, scanner))
+        tasks.append(task)
+
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def scan_target(
+    url: str,
+    scan_type: str,
+    timeout: int,
+    payloads: PayloadSet,
+    test_all: bool = False,
+    ui: UI = None
+) -> Tuple[List[str], List[Tuple[str, str, Any, Set[str]]]]:
+    """
+    Fingerprint one target and run every applicable scanner against it
+    Runs silently without a UI, so it can be used from worker processes
+    :param url: Target URL
+    :param scan_type: Scan type ('xss', 'sqli', 'http', 'redirect', 'all')
+    :param timeout: HTTP timeout setting
+    :param payloads: Payload set shared by all scanners
+    :param test_all: Inject into every parameter, including opaque tokens
+    :param ui: UI for progress and per-scanner messages (None to run silently)
+    :return: Names of skipped scanners, and (scan type, scanner name, vulnerability list
+             or error message, payloads sent) per scanner run
+    """
+    # Responses and keep-alive connections shared across scanners for this target
+    # (the per-host request cap bounds in-flight requests, so the pool is sized to match)
+    cache = ResponseCache()
+    session = create_session(Config.MAX_REQUESTS_PER_HOST)
+
+    try:
+        scanners = get_scanners_to_run(scan_type, timeout, cache, payloads, test_all, session)
+
+        # Fingerprint target first and skip scanners whose signature doesn't match
+        # (only in "all" runs; a scanner picked explicitly with -s always runs)
+        skipped = []
+        if scan_type == "all":
+            caps = fingerprint_target(url)
+            skipped = [scanner.name for scanner in scanners if not scanner.applicable(caps)]
+            scanners = [scanner for scanner in scanners if scanner.applicable(caps)]
+            if ui is not None:
+                for name in skipped:
+                    ui.print_info(f"Skipping {name}: target signature not detected")
+
+        if ui is None:
+            results = asyncio.run(run_scanners(scanners, url))
+        else:
+            # Create progress bar
+            progress = ui.create_progress_bar()
+
+            with progress:
+                # Create main progress task
+                total_scanners = len(scanners)
+                main_task = progress.add_task(
+                    f"[cyan]Scanning with {total_scanners} scanner(s)...",
+                    total=total_scanners
+                )
+
+                # Run all scanners concurrently (network-bound, so threads overlap I/O waits)
+                # Per-scanner messages are buffered and rendered once the progress bar finishes
+                ui.enable_buffering()
+                try:
+                    results = asyncio.run(run_scanners(scanners, url, ui, progress, main_task))
+                finally:
+                    ui.flush()
+    finally:
+        # Cached responses and connections belong to this target only
+        cache.clear()
+        session.close()
+
+    # Errors are passed as messages so results can cross process boundaries
+    return skipped, [
+        (
+            scanner.scan_type,
+            scanner.name,
+            str(result) if isinstance(result, BaseException) else result,
+            scanner.sent_payloads
+        )
+        for scanner, result in zip(scanners, results)
+    ]
+
+
+def scan_host_targets(urls: List[str], **scan_kwargs) -> List[Tuple[List[str], List[Tuple[str, str, Any, Set[str]]]]]:
+    """
+    Scan targets on the same host one after another (worker process entry point)
+    :param urls: Target URLs sharing one host
+    :param scan_kwargs: Keyword arguments for scan_target
+    :return: scan_target results per target, in the given order
+    """
+    return [scan_target(url, **scan_kwargs) for url in urls]
+
+
+def scan_targets_in_processes(
+    urls: List[str],
+    args: argparse.Namespace,
+    payloads: PayloadSet,
+    ui: UI
+) -> List[Tuple[List[str], List[Tuple[str, str, Any, Set[str]]]]]:
+    """
+    Scan several targets in parallel worker processes
+    Targets are grouped by host and each host is scanned by a single worker, so the
+    per-host request cap (which lives in each process) still holds across processes
+    :param urls: Target URLs
+    :param args: Parsed CLI arguments
+    :param payloads: Payload set shared by all scanners
+    :param ui: UI instance for progress output
+    :return: scan_target results per target, in target order
+    """
+    hosts: Dict[str, List[int]] = {}
+    for index, url in enumerate(urls):
+        hosts.setdefault(urlparse(url).netloc.lower(), []).append(index)
+    groups = list(hosts.values())
+
+    processes = args.processes or min(os.cpu_count() or 1, len(groups))
+    worker = functools.partial(
+        scan_host_targets,
+        scan_type=args.scan_type,
+        timeout=args.timeout,
+        payloads=payloads,
+        test_all=args.test_all
+    )
+
+    outcomes = [None] * len(urls)
+    progress = ui.create_progress_bar()
+    with progress:
+        main_task = progress.add_task(
+            f"[cyan]Scanning {len(urls)} target(s) on {len(groups)} host(s) "
+            f"in {processes} process(es)...",
+            total=len(urls)
+        )
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            group_urls = [[urls[index] for index in group] for group in groups]
+            for group, group_outcomes in zip(groups, pool.map(worker, group_urls)):
+                for index, outcome in zip(group, group_outcomes):
+                    outcomes[index] = outcome
+                progress.advance(main_task, len(group))
+
+    return outcomes
+
+
 def main():
     """Main execution function"""
     
@@ -117,101 +393,103 @@ def main():
     if not args.no_banner:
         ui.show_banner(version="2.0.0")
     
-    # Validate URL
-    if not validate_url(args.url):
-        ui.print_error("Invalid URL format (must include http/https and domain)")
-        ui.print_info("Example: https://example.com or http://testsite.com?param=value")
+    # Validate URLs
+    for url in args.urls:
+        if not validate_url(url):
+            ui.print_error(f"Invalid URL format (must include http/https and domain): {url}")
+            ui.print_info("Example: https://example.com or http://testsite.com?param=value")
+            sys.exit(1)
+
+    if args.scan_type != "all" and get_scanner_by_type(args.scan_type) is None:
+        ui.print_error(f"No scanner found for type: {args.scan_type}")
         sys.exit(1)
     
     # Display scan configuration
-    ui.print_info(f"Target: {args.url}")
+    for url in args.urls:
+        ui.print_info(f"Target: {url}")
     ui.print_info(f"Scan Type: {args.scan_type}")
     ui.print_info(f"Timeout: {args.timeout}s")
     ui.show_divider()
-    
-    # Get scanners to run
-    scanners = get_scanners_to_run(args.scan_type, args.timeout)
-    
-    if not scanners:
-        ui.print_error(f"No scanner found for type: {args.scan_type}")
-        sys.exit(1)
-    
-    # Initialize results
-    all_vulnerabilities = []
-    scan_types_performed = []
-    
-    # Create progress bar
-    progress = ui.create_progress_bar()
-    
-    with progress:
-        # Create main progress task
-        total_scanners = len(scanners)
-        main_task = progress.add_task(
-            f"[cyan]Scanning with {total_scanners} scanner(s)...",
-            total=total_scanners
+
+    # Proven payloads from previous scans are sent first
+    ranker = PayloadRanker().load()
+    payloads = build_payloads(ranker)
+
+    if len(args.urls) == 1:
+        outcomes = [scan_target(args.urls[0], args.scan_type, args.timeout, payloads, args.test_all, ui)]
+    else:
+        outcomes = scan_targets_in_processes(args.urls, args, payloads, ui)
+
+    total_vulnerabilities = 0
+    # Payloads sent and hit per scanner type over all targets, recorded once per scan
+    sent_payloads: Dict[str, Set[str]] = {}
+    hit_payloads: Dict[str, Set[str]] = {}
+    for index, (url, (skipped, outcome)) in enumerate(zip(args.urls, outcomes), 1):
+        # Initialize results
+        all_vulnerabilities = []
+        scan_types_performed = []
+
+        # Worker processes run silently, so their per-scanner messages are shown here
+        # (a single target already reported them live)
+        if len(args.urls) > 1:
+            for name in skipped:
+                ui.print_info(f"Skipping {name} on {url}: target signature not detected")
+            for _, name, result, _ in outcome:
+                print_scanner_result(ui, f"{name} on {url}", result)
+
+        # Collect results in scanner order
+        for scan_type, name, vulnerabilities, sent in outcome:
+            if isinstance(vulnerabilities, str):
+                continue
+            all_vulnerabilities.extend(vulnerabilities)
+            scan_types_performed.append(name)
+            sent_payloads.setdefault(scan_type, set()).update(sent)
+            hit_payloads.setdefault(scan_type, set()).update(vuln.get("payload") for vuln in vulnerabilities)
+
+        ui.show_divider()
+
+        # Display vulnerability table if any found
+        if all_vulnerabilities:
+            ui.show_vulnerability_table(all_vulnerabilities)
+
+        # Show scan summary
+        ui.show_scan_summary(
+            target_url=url,
+            scan_types=scan_types_performed,
+            total_vulns=len(all_vulnerabilities)
         )
-        
-        # Run each scanner
-        for scanner in scanners:
-            # Update progress description
-            progress.update(main_task, description=f"[cyan]Running {scanner.name}...")
-            
-            # Run scan
-            try:
-                vulnerabilities = scanner.scan(args.url)
-                all_vulnerabilities.extend(vulnerabilities)
-                scan_types_performed.append(scanner.name)
-                
-                # Show results for this scanner
-                if vulnerabilities:
-                    ui.print_vulnerability(
-                        scanner.name,
-                        f"Found {len(vulnerabilities)} issue(s)"
-                    )
-                else:
-                    ui.print_success(f"{scanner.name}: No vulnerabilities detected")
-                    
-            except Exception as e:
-                ui.print_error(f"{scanner.name} failed: {str(e)}")
-            
-            # Update progress
-            progress.advance(main_task)
-    
-    ui.show_divider()
-    
-    # Display vulnerability table if any found
-    if all_vulnerabilities:
-        ui.show_vulnerability_table(all_vulnerabilities)
-    
-    # Show scan summary
-    ui.show_scan_summary(
-        target_url=args.url,
-        scan_types=scan_types_performed,
-        total_vulns=len(all_vulnerabilities)
-    )
-    
-    # Generate report
-    reporter = Reporter(ui)
-    output_path_with_ext = f"{args.output}.{args.format}"
-    
-    ui.print_info(f"Generating {args.format.upper()} report...")
-    reporter.generate_report(
-        vulnerabilities=all_vulnerabilities,
-        target_url=args.url,
-        output_path=output_path_with_ext,
-        format=args.format
-    )
+
+        # Generate report (one per target)
+        reporter = Reporter(ui)
+        output_path = args.output if len(args.urls) == 1 else f"{args.output}_{index}"
+        output_path_with_ext = f"{output_path}.{args.format}"
+
+        ui.print_info(f"Generating {args.format.upper()} report...")
+        reporter.generate_report(
+            vulnerabilities=all_vulnerabilities,
+            target_url=url,
+            output_path=output_path_with_ext,
+            format=args.format,
+            fields=args.fields.split(",") if args.fields else None
+        )
+        total_vulnerabilities += len(all_vulnerabilities)
+
+    record_payload_hits(ranker, payloads, sent_payloads, hit_payloads)
+    try:
+        ranker.save()
+    except OSError as e:
+        ui.print_warning(f"Could not save payload stats: {str(e)}")
     
     # Final summary
     ui.show_divider()
-    if all_vulnerabilities:
-        ui.print_warning(f"Scan completed! {len(all_vulnerabilities)} vulnerabilities detected")
+    if total_vulnerabilities:
+        ui.print_warning(f"Scan completed! {total_vulnerabilities} vulnerabilities detected")
         ui.print_info("Review the report for detailed information")
     else:
         ui.print_success("Scan completed! No vulnerabilities detected")
     
     # Exit with appropriate code
-    sys.exit(1 if all_vulnerabilities else 0)
+    sys.exit(1 if total_vulnerabilities else 0)
 
 
 if __name__ == "__main__":
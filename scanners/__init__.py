@@ -1,24 +1,32 @@
 """
 Scanner Module Package
-Auto-discovery and registration of all vulnerability scanners
+Lazy registration of all vulnerability scanners
 """
 
-from typing import List, Type
+import importlib
+from typing import Dict, List, Type
 from core.base_scanner import BaseScanner
 
-# Import all scanner implementations
-from .xss_scanner import XSSScanner
-from .sqli_scanner import SQLiScanner
-from .http_scanner import HTTPScanner
-from .redirect_scanner import RedirectScanner
-
-# Scanner registry for auto-discovery
-AVAILABLE_SCANNERS: List[Type[BaseScanner]] = [
-    XSSScanner,
-    SQLiScanner,
-    HTTPScanner,
-    RedirectScanner,
-]
+# Scanner registry: scan type -> "module:Class", imported only when requested
+_REGISTRY: Dict[str, str] = {
+    "xss": ".xss_scanner:XSSScanner",
+    "sqli": ".sqli_scanner:SQLiScanner",
+    "http": ".http_scanner:HTTPScanner",
+    "redirect": ".redirect_scanner:RedirectScanner",
+}
+
+# Class name -> registry entry, for lazy attribute access
+_CLASS_NAMES: Dict[str, str] = {spec.split(":")[1]: spec for spec in _REGISTRY.values()}
+
+
+def _load(spec: str) -> Type[BaseScanner]:
+    """
+    Import scanner class from a registry entry
+    :param spec: Registry entry ("module:Class", module relative to this package)
+    :return: Scanner class
+    """
+    module_name, class_name = spec.split(":")
+    return getattr(importlib.import_module(module_name, __name__), class_name)
 
 
 def get_scanner_by_type(scan_type: str) -> Type[BaseScanner]:
@@ -27,11 +35,8 @@ def get_scanner_by_type(scan_type: str) -> Type[BaseScanner]:
     :param scan_type: Scanner type (e.g., 'xss', 'sqli', 'all')
     :return: Scanner class or None
     """
-    for scanner_class in AVAILABLE_SCANNERS:
-        scanner_instance = scanner_class()
-        if scanner_instance.scan_type == scan_type:
-            return scanner_class
-    return None
+    spec = _REGISTRY.get(scan_type)
+    return _load(spec) if spec else None
 
 
 def get_all_scanners() -> List[Type[BaseScanner]]:
@@ -39,7 +44,24 @@ def get_all_scanners() -> List[Type[BaseScanner]]:
     Get all available scanner classes
     :return: List of scanner classes
     """
-    return AVAILABLE_SCANNERS
+    return [_load(spec) for spec in _REGISTRY.values()]
+
+
+def get_scan_types() -> List[str]:
+    """
+    Get all registered scan type identifiers (without importing scanners)
+    :return: List of scan types
+    """
+    return list(_REGISTRY)
+
+
+def __getattr__(name: str):
+    """Resolve scanner classes and AVAILABLE_SCANNERS lazily on first access"""
+    if name in _CLASS_NAMES:
+        return _load(_CLASS_NAMES[name])
+    if name == "AVAILABLE_SCANNERS":
+        return get_all_scanners()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -50,4 +72,5 @@ __all__ = [
     "AVAILABLE_SCANNERS",
     "get_scanner_by_type",
     "get_all_scanners",
+    "get_scan_types",
 ]
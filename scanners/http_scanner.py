@@ -4,14 +4,22 @@ Detects missing security headers and insecure HTTP methods
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from core.base_scanner import BaseScanner
+from core.http_cache import read_snapshot
 from core.config import Config
 
 
+# Normalised once at import: Allow values are upper-cased before the intersection
+_FORBIDDEN_METHODS = frozenset(method.upper() for method in Config.FORBIDDEN_HTTP_METHODS)
+
+
 class HTTPScanner(BaseScanner):
     """HTTP misconfiguration scanner"""
 
+    scan_type = "http"
+
     @property
     def name(self) -> str:
         return "HTTP Misconfig Scanner"
@@ -20,10 +28,6 @@ class HTTPScanner(BaseScanner):
     def description(self) -> str:
         return "Detects missing security headers and insecure HTTP methods"
 
-    @property
-    def scan_type(self) -> str:
-        return "http"
-
     def scan(self, target_url: str, params: Dict[str, str] = None) -> List[Dict[str, Any]]:
         """
         Scan for HTTP misconfigurations
@@ -33,40 +37,52 @@ class HTTPScanner(BaseScanner):
         """
         self.reset()
 
+        # Header and method checks are independent, so send both requests at once.
+        # Headers come from HEAD (no body download), through the shared response cache
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            headers_future = executor.submit(
+                self.cache.get_headers, self.session, target_url, timeout=self.timeout, allow_redirects=True
+            )
+            options_future = executor.submit(
+                self.session.options, target_url, timeout=self.timeout, stream=True
+            )
+
+        # 1. Check for missing security headers
         try:
-            # 1. Check for missing security headers
-            response = requests.get(target_url, timeout=self.timeout, allow_redirects=True)
-            response_headers = {k.lower(): v for k, v in response.headers.items()}
+            response = headers_future.result()
 
+            # response.headers is a CaseInsensitiveDict, so lookups ignore case already
             for header in Config.REQUIRED_SECURITY_HEADERS:
-                if header.lower() not in response_headers:
-                    vulnerability = {
-                        "type": "HTTP Misconfiguration",
-                        "issue": "Missing Security Header",
-                        "details": f"Header '{header}' is missing (critical for security hardening)",
-                        "url": target_url,
-                        "status_code": response.status_code
-                    }
+                if header not in response.headers:
+                    vulnerability = self._vuln(
+                        type="HTTP Misconfiguration",
+                        issue="Missing Security Header",
+                        details=f"Header '{header}' is missing (critical for security hardening)",
+                        url=target_url,
+                        status_code=response.status_code
+                    )
                     self.vulnerabilities.append(vulnerability)
+        except requests.exceptions.RequestException:
+            pass
 
-            # 2. Check for insecure HTTP methods (TRACE/TRACK)
-            try:
-                options_response = requests.options(target_url, timeout=self.timeout)
-                allowed_methods = options_response.headers.get("Allow", "").split(", ")
-
-                for method in Config.FORBIDDEN_HTTP_METHODS:
-                    if method in allowed_methods:
-                        vulnerability = {
-                            "type": "HTTP Misconfiguration",
-                            "issue": "Insecure HTTP Method Enabled",
-                            "details": f"Method '{method}' is allowed (can be used for cross-site tracing attacks)",
-                            "url": target_url,
-                            "status_code": options_response.status_code
-                        }
-                        self.vulnerabilities.append(vulnerability)
-            except requests.exceptions.RequestException:
-                pass
+        # 2. Check for insecure HTTP methods (TRACE/TRACK)
+        try:
+            options_response = read_snapshot(options_future.result())
+            # Tolerate any spacing/case in the Allow list (e.g., "GET,trace")
+            allowed_methods = {
+                method.strip().upper() for method in options_response.headers.get("Allow", "").split(",")
+            }
 
+            # Sorted for a stable report order (only the few enabled methods)
+            for method in sorted(_FORBIDDEN_METHODS & allowed_methods):
+                vulnerability = self._vuln(
+                    type="HTTP Misconfiguration",
+                    issue="Insecure HTTP Method Enabled",
+                    details=f"Method '{method}' is allowed (can be used for cross-site tracing attacks)",
+                    url=target_url,
+                    status_code=options_response.status_code
+                )
+                self.vulnerabilities.append(vulnerability)
         except requests.exceptions.RequestException:
             pass
 
@@ -3,16 +3,21 @@ Open Redirect Scanner
 Detects unvalidated redirect vulnerabilities
 """
 
-import requests
-from typing import List, Dict, Any
-from urllib.parse import urlparse, urlencode
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
 from core.base_scanner import BaseScanner
 from core.config import Config
 
 
+# Parsed once at import; every probe's Location header is compared against it
+_MALICIOUS_NETLOC = urlparse(Config.MALICIOUS_REDIRECT_TARGET).netloc
+
+
 class RedirectScanner(BaseScanner):
     """Open redirect vulnerability scanner"""
 
+    scan_type = "redirect"
+
     @property
     def name(self) -> str:
         return "Open Redirect Scanner"
@@ -21,10 +26,6 @@ class RedirectScanner(BaseScanner):
     def description(self) -> str:
         return "Detects unvalidated redirect vulnerabilities"
 
-    @property
-    def scan_type(self) -> str:
-        return "redirect"
-
     def scan(self, target_url: str, params: Dict[str, str] = None) -> List[Dict[str, Any]]:
         """
         Scan for open redirect vulnerabilities
@@ -33,40 +34,39 @@ class RedirectScanner(BaseScanner):
         :return: List of open redirect vulnerabilities
         """
         self.reset()
-        
-        parsed_base_url = urlparse(target_url)
-        base_domain = parsed_base_url.netloc
-
-        # Test common redirect parameters with malicious target
-        for param in Config.REDIRECT_PARAMS:
-            # Build URL with redirect parameter pointing to malicious domain
-            redirect_params = {param: Config.MALICIOUS_REDIRECT_TARGET}
-            test_url = f"{self.get_base_url(target_url)}?{urlencode(redirect_params)}"
 
-            try:
-                response = requests.get(
-                    test_url,
-                    timeout=self.timeout,
-                    allow_redirects=True  # Follow redirects to check final destination
-                )
+        # Test common redirect parameters with malicious target (original query dropped)
+        build_url = self._url_builder(self.get_base_url(target_url), {})
+        tasks = [
+            (param, build_url(param, Config.MALICIOUS_REDIRECT_TARGET), None, False)
+            for param in Config.REDIRECT_PARAMS
+        ]
 
-                # Check if final URL is the malicious target (open redirect confirmed)
-                final_redirect_url = response.url
-                parsed_final_url = urlparse(final_redirect_url)
-                final_domain = parsed_final_url.netloc
-
-                if final_domain == urlparse(Config.MALICIOUS_REDIRECT_TARGET).netloc:
-                    vulnerability = {
-                        "type": "Open Redirect",
-                        "parameter": param,
-                        "url": test_url,
-                        "redirected_to": final_redirect_url,
-                        "status_code": response.status_code,
-                        "description": "Unvalidated redirect parameter allows navigation to malicious domain"
-                    }
-                    self.vulnerabilities.append(vulnerability)
-
-            except requests.exceptions.RequestException:
-                continue
+        # Redirects are not followed: the Location header of the first hop is
+        # enough to confirm the issue, without navigating to the malicious domain
+        probes = self._dispatch(tasks, check=self._probe, allow_redirects=False)
+        for param, (url, location, status_code) in probes:
+            vulnerability = self._vuln(
+                type="Open Redirect",
+                parameter=param,
+                url=url,
+                redirected_to=location,
+                status_code=status_code,
+                description="Unvalidated redirect parameter allows navigation to malicious domain"
+            )
+            self.vulnerabilities.append(vulnerability)
 
         return self.vulnerabilities
+
+    @staticmethod
+    def _probe(param: str, response: Any) -> Optional[Tuple[str, str, int]]:
+        """
+        Check whether a probe redirects to the malicious domain
+        :param param: Redirect parameter the probe was sent with
+        :param response: Probe response snapshot
+        :return: (probe URL, Location header, status code) if it points to the malicious domain, otherwise None
+        """
+        location = response.headers.get("Location", "")
+        if urlparse(location).netloc == _MALICIOUS_NETLOC:
+            return response.url, location, response.status_code
+        return None
@@ -1,28 +1,35 @@
 """
 SQL Injection Scanner
-Detects error-based and boolean-based SQL injection vulnerabilities
+Detects error-based, boolean-based and time-based SQL injection vulnerabilities
 """
 
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from core.base_scanner import BaseScanner
+from core.http_cache import read_snapshot
 from core.config import Config
 
 
 class SQLiScanner(BaseScanner):
     """SQL Injection vulnerability scanner"""
 
+    scan_type = "sqli"
+    # Techniques served by the regular payloads, tracked separately for early exit
+    # (distinct DB fingerprints); time-based findings are confirmed after the batch
+    PAYLOAD_TECHNIQUES = ("error", "boolean")
+
     @property
     def name(self) -> str:
         return "SQLi Scanner"
 
     @property
     def description(self) -> str:
-        return "Detects SQL Injection vulnerabilities (error-based and boolean-based)"
+        return "Detects SQL Injection vulnerabilities (error-based, boolean-based and time-based)"
 
-    @property
-    def scan_type(self) -> str:
-        return "sqli"
+    @classmethod
+    def applicable(cls, caps: Dict[str, Any]) -> bool:
+        # SQLi requires user-controlled input
+        return caps.get("has_params", True)
 
     def scan(self, target_url: str, params: Dict[str, str] = None) -> List[Dict[str, Any]]:
         """
@@ -37,60 +44,174 @@ class SQLiScanner(BaseScanner):
         if not params:
             params = self.extract_params(target_url)
 
-        if not params:
+        # Opaque tokens are kept in the query but not injected into
+        targets = self.injectable_params(params)
+
+        if not targets:
             return self.vulnerabilities
 
-        # Test each SQLi payload against every parameter
-        for payload in Config.SQLI_PAYLOADS:
-            for param in params:
-                modified_params = params.copy()
-                modified_params[param] = payload
-
-                try:
-                    response = requests.get(
-                        self.get_base_url(target_url),
-                        params=modified_params,
-                        timeout=self.timeout,
-                        allow_redirects=False
-                    )
-
-                    # Check for SQL errors in response (error-based SQLi)
-                    for error_pattern in Config.SQL_ERROR_PATTERNS:
-                        if error_pattern in response.text:
-                            vulnerability = {
-                                "type": "SQL Injection (Error-Based)",
-                                "payload": payload,
-                                "parameter": param,
-                                "url": response.url,
-                                "status_code": response.status_code,
-                                "description": f"SQL error detected: {error_pattern}"
-                            }
-                            self.vulnerabilities.append(vulnerability)
-                            break  # Avoid duplicate entries for same payload/param
-
-                    # Check for boolean-based SQLi (response length change)
-                    try:
-                        original_response = requests.get(
-                            self.get_base_url(target_url),
-                            params={param: params[param]},
-                            timeout=self.timeout
-                        )
-                        length_diff = abs(len(response.text) - len(original_response.text))
-                        
-                        if length_diff > Config.RESPONSE_LENGTH_THRESHOLD:
-                            vulnerability = {
-                                "type": "SQL Injection (Boolean-Based)",
-                                "payload": payload,
-                                "parameter": param,
-                                "url": response.url,
-                                "status_code": response.status_code,
-                                "description": f"Significant response length change ({length_diff} bytes)"
-                            }
-                            self.vulnerabilities.append(vulnerability)
-                    except requests.exceptions.RequestException:
-                        pass
-
-                except requests.exceptions.RequestException:
+        base_url = self.get_base_url(target_url)
+
+        # Baselines: one unmodified request per parameter, identical for every
+        # payload, so fetch them all (concurrently) once up front
+        baseline_tasks = [
+            (param, base_url, {param: params[param]}, True)
+            for param in targets
+        ]
+        baselines = dict(self._dispatch(
+            baseline_tasks,
+            check=lambda param, response: (len(response.content), response.elapsed),
+            payload_probes=False,
+            allow_redirects=False
+        ))
+
+        # Build one probe per (payload, parameter) pair
+        build_url = self._url_builder(base_url, params)
+        tasks = []
+        for entry in self.payloads.for_family(self.scan_type):
+            payload = entry.text
+            for param in targets:
+                if entry.shared:
+                    # Shared probes go through the response cache, keyed by params
+                    modified_params = params.copy()
+                    modified_params[param] = payload
+                    tasks.append(((param, payload), base_url, modified_params, True))
+                else:
+                    tasks.append(((param, payload), build_url(param, payload), None, False))
+
+        # Sleep probes come last in consumption order, so waiting on a delayed one
+        # never holds back the error/boolean results; their chains still run alongside
+        # the others. They are only sent when the timeout leaves room for the delay to show up
+        time_payloads = Config.SQLI_TIME_PAYLOADS if self.timeout > Config.SQLI_SLEEP_SECONDS else ()
+        tasks.extend(
+            ((param, payload), build_url(param, payload), None, False)
+            for payload in time_payloads
+            for param in targets
+        )
+
+        # Send probes concurrently (request errors are silently skipped); each
+        # parameter's payloads go out one after another and are analysed in the
+        # worker threads, which confirm findings right away, so only findings come
+        # back and a parameter is dropped once every payload technique has confirmed it
+        def skip(tag: Tuple[str, str]) -> bool:
+            param, payload = tag
+            if payload in time_payloads:
+                return False
+            return all(self._is_confirmed(self.scan_type, t, param) for t in self.PAYLOAD_TECHNIQUES)
+
+        def check(tag: Tuple[str, str], response: Any) -> Any:
+            param, payload = tag
+            if payload not in time_payloads:
+                return self._probe(param, payload, response, baselines.get(param)) or None
+            # Check for a delayed response (time-based SQLi candidate)
+            if param in baselines and response.elapsed - baselines[param][1] >= Config.SQLI_SLEEP_THRESHOLD:
+                return True
+            return None
+
+        # Delayed sleep probes per parameter; only candidates until re-checked alone,
+        # since on a server handling one request at a time every probe queued behind
+        # a real sleep looks delayed too. Each sleep probe is a chain of its own
+        time_candidates: Dict[str, List[str]] = {}
+
+        probes = self._dispatch(
+            tasks,
+            skip=skip,
+            check=check,
+            chain=lambda tag: tag if tag[1] in time_payloads else tag[0],
+            allow_redirects=False
+        )
+        for (param, payload), result in probes:
+            if payload in time_payloads:
+                time_candidates.setdefault(param, []).append(payload)
+            else:
+                self.vulnerabilities.extend(result)
+
+        # Confirm time-based candidates one request at a time, outside the batch
+        for param, candidates in time_candidates.items():
+            control_url = build_url(param, params[param])
+            for payload in candidates:
+                url = build_url(param, payload)
+                confirmed = self._confirm_delay(control_url, url)
+                if confirmed is None:
                     continue
+                delay, status_code = confirmed
+                vulnerability = self._vuln(
+                    type="SQL Injection (Time-Based)",
+                    payload=payload,
+                    parameter=param,
+                    url=url,
+                    status_code=status_code,
+                    description=f"Response delayed by {delay:.1f}s over control request"
+                )
+                self.vulnerabilities.append(vulnerability)
+                break
 
         return self.vulnerabilities
+
+    def _confirm_delay(self, control_url: str, probe_url: str) -> Optional[Tuple[float, int]]:
+        """
+        Re-send a delayed sleep probe on its own, right after a control request carrying
+        the original value, and require the delay to show up again
+        :param control_url: Probe URL with the parameter's original value
+        :param probe_url: Probe URL with the sleep payload
+        :return: (delay over the control in seconds, status code) if reproduced, otherwise None
+        """
+        try:
+            control = read_snapshot(self._send_probe(control_url, allow_redirects=False))
+            probe = read_snapshot(self._send_probe(probe_url, allow_redirects=False))
+        except requests.exceptions.RequestException:
+            return None
+        delay = probe.elapsed - control.elapsed
+        if delay >= Config.SQLI_SLEEP_THRESHOLD:
+            return delay, probe.status_code
+        return None
+
+    def _probe(
+        self,
+        param: str,
+        payload: str,
+        response: Any,
+        baseline: Optional[Tuple[int, float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Check a probe response for error-based and boolean-based SQLi
+        Findings are confirmed right away, so the parameter's remaining payloads are skipped
+        :param param: Parameter the probe was sent with
+        :param payload: Payload the probe was sent with
+        :param response: Probe response snapshot
+        :param baseline: (body length, elapsed seconds) of the parameter's baseline, if fetched
+        :return: Vulnerabilities found in this response
+        """
+        found = []
+
+        # Check for SQL errors in response (error-based SQLi)
+        if not self._is_confirmed(self.scan_type, "error", param):
+            sql_error = Config.search_sql_error(response.content)
+            if sql_error:
+                found.append(self._vuln(
+                    type="SQL Injection (Error-Based)",
+                    payload=payload,
+                    parameter=param,
+                    url=response.url,
+                    status_code=response.status_code,
+                    description=f"SQL error detected: {sql_error}"
+                ))
+                self._confirm(self.scan_type, "error", param)
+
+        # Check for boolean-based SQLi (response length change)
+        if baseline is None or self._is_confirmed(self.scan_type, "boolean", param):
+            return found
+        length_diff = abs(len(response.content) - baseline[0])
+
+        if length_diff > Config.RESPONSE_LENGTH_THRESHOLD:
+            found.append(self._vuln(
+                type="SQL Injection (Boolean-Based)",
+                payload=payload,
+                parameter=param,
+                url=response.url,
+                status_code=response.status_code,
+                description=f"Significant response length change ({length_diff} bytes)"
+            ))
+            self._confirm(self.scan_type, "boolean", param)
+
+        return found
@@ -3,15 +3,15 @@ XSS (Cross-Site Scripting) Scanner
 Detects reflected XSS vulnerabilities
 """
 
-import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from core.base_scanner import BaseScanner
-from core.config import Config
 
 
 class XSSScanner(BaseScanner):
     """XSS vulnerability scanner"""
 
+    scan_type = "xss"
+
     @property
     def name(self) -> str:
         return "XSS Scanner"
@@ -20,9 +20,10 @@ class XSSScanner(BaseScanner):
     def description(self) -> str:
         return "Detects reflected Cross-Site Scripting (XSS) vulnerabilities"
 
-    @property
-    def scan_type(self) -> str:
-        return "xss"
+    @classmethod
+    def applicable(cls, caps: Dict[str, Any]) -> bool:
+        # XSS requires user-controlled input
+        return caps.get("has_params", True)
 
     def scan(self, target_url: str, params: Dict[str, str] = None) -> List[Dict[str, Any]]:
         """
@@ -37,40 +38,66 @@ class XSSScanner(BaseScanner):
         if not params:
             params = self.extract_params(target_url)
 
+        # Opaque tokens are kept in the query but not injected into
+        targets = self.injectable_params(params)
+
         # If no params exist (static URL), skip (XSS requires user-controlled input)
-        if not params:
+        if not targets:
             return self.vulnerabilities
 
-        # Test each XSS payload against every parameter
-        for payload in Config.XSS_PAYLOADS:
-            for param in params:
-                # Create modified params with payload injected
-                modified_params = params.copy()
-                modified_params[param] = payload
+        base_url = self.get_base_url(target_url)
+        build_url = self._url_builder(base_url, params)
 
-                try:
-                    # Send GET request with injected payload
-                    response = requests.get(
-                        self.get_base_url(target_url),
-                        params=modified_params,
-                        timeout=self.timeout,
-                        allow_redirects=False
-                    )
+        # Build one probe per (payload, parameter) pair; payloads are matched
+        # as bytes against the raw body, so responses never need decoding
+        tasks = []
+        needles = {}
+        for entry in self.payloads.for_family(self.scan_type):
+            payload = entry.text
+            needles[payload] = payload.encode("utf-8")
+            for param in targets:
+                if entry.shared:
+                    # Create modified params with payload injected (cache key)
+                    modified_params = params.copy()
+                    modified_params[param] = payload
+                    tasks.append(((param, payload), base_url, modified_params, True))
+                else:
+                    tasks.append(((param, payload), build_url(param, payload), None, False))
 
-                    # Check if payload is reflected UNESCAPED in response
-                    if payload in response.text:
-                        vulnerability = {
-                            "type": "XSS (Reflected)",
-                            "payload": payload,
-                            "parameter": param,
-                            "url": response.url,
-                            "status_code": response.status_code,
-                            "description": "Unescaped XSS payload reflected in response"
-                        }
-                        self.vulnerabilities.append(vulnerability)
-
-                except requests.exceptions.RequestException:
-                    # Silently continue on request errors
-                    continue
+        # Send probes concurrently (request errors are silently skipped); each
+        # parameter's payloads go out one after another, the reflection check runs
+        # in the worker threads and confirms hits right away, so only hits come back
+        # and a parameter proven vulnerable receives no further payloads
+        probes = self._dispatch(
+            tasks,
+            skip=lambda tag: self._is_confirmed(self.scan_type, tag[0]),
+            check=lambda tag, response: self._probe(tag[0], needles[tag[1]], response),
+            chain=lambda tag: tag[0],
+            allow_redirects=False
+        )
+        for (param, payload), (url, status_code) in probes:
+            vulnerability = self._vuln(
+                type="XSS (Reflected)",
+                payload=payload,
+                parameter=param,
+                url=url,
+                status_code=status_code,
+                description="Unescaped XSS payload reflected in response"
+            )
+            self.vulnerabilities.append(vulnerability)
 
         return self.vulnerabilities
+
+    def _probe(self, param: str, needle: bytes, response: Any) -> Optional[Tuple[str, int]]:
+        """
+        Check a probe response for an unescaped payload reflection
+        A reflection confirms the parameter, so its remaining payloads are skipped
+        :param param: Parameter the probe was sent with
+        :param needle: Encoded payload the probe was sent with
+        :param response: Probe response snapshot
+        :return: (response URL, status code) if the payload is reflected, otherwise None
+        """
+        if needle not in response.content:
+            return None
+        self._confirm(self.scan_type, param)
+        return response.url, response.status_code